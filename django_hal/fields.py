@@ -4,12 +4,67 @@ Serializer fields for django_hal
 """
 
 
-from collections import OrderedDict
-
-from django.utils.http import urlencode
 from rest_framework import serializers
 
-from .utils import reverse
+from .utils import (
+    reverse, NoReverseMatch, _append_query, _cached_reverse,
+    _compile_kwargs, _compile_query, _with_query, _str_types, _Dict)
+
+
+def _link_no_kwargs(request, instance, urlpattern, query_spec):
+    """Return a link dict for a urlpattern that takes no kwargs."""
+    url = _cached_reverse(urlpattern, None, request)
+    return {'href': _append_query(url, query_spec, instance)}
+
+
+def _link_str_kwarg(request, instance, urlpattern, name, query_spec):
+    """Return a link dict for the `(ref, urlpattern, string)` shorthand."""
+    try:
+        url = _cached_reverse(urlpattern, ((name, getattr(instance, name)),),
+                              request)
+    except NoReverseMatch:
+        return None
+    return {'href': _append_query(url, query_spec, instance)}
+
+
+def _link_dict_kwargs(request, instance, urlpattern, kwargs_spec,
+                      query_spec):
+    """Return a link dict for a urlpattern with `(kwarg, attribute)` pairs."""
+    keys, getter = kwargs_spec
+    # Whether a pattern reverses depends on the instance's values (e.g., an
+    # unsaved instance has no pk), not only on the pattern itself, so this
+    # can't be checked once up front.
+    try:
+        url = _cached_reverse(urlpattern, tuple(zip(keys, getter(instance))),
+                              request)
+    except NoReverseMatch:
+        return None
+    return {'href': _append_query(url, query_spec, instance)}
+
+
+def _compile_link(link):
+    """Compile a `LinksField` link tuple into `(name, to_link, args)`.
+
+    `to_link` is whichever of the `_link_*` functions handles the shape of the
+    link's kwargs, and `args` are the (pre-normalized) arguments to call it
+    with, after the request and instance.  The shape of a link is fixed when
+    the field is declared, so it is only inspected here, rather than for every
+    instance serialized.
+
+    """
+    name, urlpattern = link[0], link[1]
+    kwargs = link[2] if len(link) > 2 else None
+    query_kwargs = link[3] if len(link) > 3 else None
+    query_spec = _compile_query(query_kwargs)
+
+    if not kwargs:
+        return name, _link_no_kwargs, (urlpattern, query_spec)
+    if isinstance(kwargs, _str_types):
+        # `(ref, urlpattern, string)` where `string` is equivalent to
+        # `{string: string}`
+        return name, _link_str_kwarg, (urlpattern, kwargs, query_spec)
+    return (name, _link_dict_kwargs,
+            (urlpattern, _compile_kwargs(kwargs), query_spec))
 
 
 class LinksField(serializers.DictField):
@@ -78,14 +133,24 @@ class LinksField(serializers.DictField):
     def __init__(self, *links):
         super(LinksField, self).__init__(read_only=True)
         self.links = links
+        self._compiled = [_compile_link(link) for link in links]
+        self._request = None
+
+    def bind(self, field_name, parent):
+        super(LinksField, self).bind(field_name, parent)
+        # Looked up from the context on first use; see `to_representation`.
+        self._request = None
 
     def to_representation(self, instance):
         """Return an ordered dictionary of HAL-style links."""
-        request = self.context.get('request')
-        ret = OrderedDict()
-        for link in self.links:
-            name = link[0]
-            ret[name] = self.to_link(request, instance, *link[1:])
+        # The request is the same for every row of a list, so only look it up
+        # through the (root serializer's) context once.
+        request = self._request
+        if request is None:
+            request = self._request = self.context.get('request')
+        ret = _Dict()
+        for name, to_link, args in self._compiled:
+            ret[name] = to_link(request, instance, *args)
         return ret
 
     def get_attribute(self, instance, *args, **kwargs):
@@ -105,35 +170,9 @@ class LinksField(serializers.DictField):
     def to_link(self, request, instance, urlpattern, kwargs=None,
                 query_kwargs=None):
         """Return an absolute url for the given urlpattern."""
-        if query_kwargs:
-            query_kwargs = {k: getattr(instance, v) for k, v in query_kwargs.items()}
-        if not kwargs:
-            url = reverse(urlpattern, request=request)
-            if not query_kwargs:
-                return {'href': url}
-            return {'href': '%s?%s' % (url, urlencode(query_kwargs))}
-
-        if isinstance(kwargs, basestring):
-            # `(ref, urlpattern, string)` where `string` is equivalent to
-            # `{string: string}`
-            url = reverse(urlpattern,
-                          kwargs={kwargs: getattr(instance, kwargs)},
-                          request=request)
-            if not query_kwargs:
-                return {'href': url}
-            return {'href': '%s?%s' % (url, urlencode(query_kwargs))}
-
-        reverse_kwargs = {}
-        if kwargs:
-            for k, v in kwargs.items():
-                reverse_kwargs[k] = getattr(instance, v)
-        try:
-            url = reverse(urlpattern, kwargs=reverse_kwargs, request=request)
-            if not query_kwargs:
-                return {'href': url}
-            return {'href': '%s?%s' % (url, urlencode(query_kwargs))}
-        except NoReverseMatch:
-            return None
+        _, to_link, args = _compile_link(
+            (None, urlpattern, kwargs, query_kwargs))
+        return to_link(request, instance, *args)
 
 
 class QueryField(serializers.HyperlinkedIdentityField):
@@ -198,6 +237,6 @@ class QueryField(serializers.HyperlinkedIdentityField):
                       request=request,
                       format=response_format)
         query_kwargs = {self.query_kwarg: lookup_value}
-        return u'%s?%s' % (url, urlencode(query_kwargs))
+        return _with_query(url, query_kwargs)
 
 
@@ -5,14 +5,24 @@ HAL serializers for Django REST Framework.
 
 from __future__ import print_function
 
-from collections import OrderedDict
+import copy
+from collections import namedtuple
 
-from django.core import urlresolvers
-from django.utils.http import urlencode
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+
+from django.db import models
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.renderers import BrowsableAPIRenderer, HTMLFormRenderer
 from rest_framework.utils.serializer_helpers import ReturnDict
 
-from .utils import reverse, move_request_from_kwargs_to_context
+from .utils import (
+    reverse, move_request_from_kwargs_to_context, NoReverseMatch,
+    _append_query, _cached_reverse, _compile_kwargs, _compile_query,
+    _str_types, _Dict)
 
 # DEPRECATED: Import fields to make them available as:
 #             ``from django_hal.serializers import LinksField, QueryField``
@@ -20,77 +30,107 @@ from .utils import reverse, move_request_from_kwargs_to_context
 from .fields import LinksField, QueryField
 
 
-def _to_link(self, request, instance, urlpattern, kwargs=None,
-            query_kwargs=None):
-    """Return an absolute url for the given urlpattern."""
-    if query_kwargs:
-        query_kwargs = {k: getattr(instance, v) for k, v in query_kwargs.items()}
-    if not kwargs:
-        url = reverse(urlpattern, request=request)
-        if not query_kwargs:
-            return {'href': url}
-        return {'href': '%s?%s' % (url, urlencode(query_kwargs))}
-
-    if isinstance(kwargs, basestring):
-        # `(ref, urlpattern, string)` where `string` is equivalent to
-        # `{string: string}`
-        url = reverse(urlpattern,
-                      kwargs={kwargs: getattr(instance, kwargs)},
-                      request=request)
-        if not query_kwargs:
-            return {'href': url}
-        return {'href': '%s?%s' % (url, urlencode(query_kwargs))}
-
-    reverse_kwargs = {}
-    if kwargs:
-        for k, v in kwargs.items():
-            reverse_kwargs[k] = getattr(instance, v)
-    try:
-        url = reverse(urlpattern, kwargs=reverse_kwargs, request=request)
-        if not query_kwargs:
-            return {'href': url}
-        return {'href': '%s?%s' % (url, urlencode(query_kwargs))}
-    except urlresolvers.NoReverseMatch:
-        return None
+# Normalized ``Meta`` options for a ``HALModelSerializer`` subclass, cached per
+# class by ``HALModelSerializer._hal_meta``.
+#
+_HALMeta = namedtuple('_HALMeta',
+                      ['links', 'detail_pattern', 'detail_kwargs_spec',
+                       'lazy_links', 'rels', 'links_by_rel'])
+
+# The compiled ``Meta`` options (and fields) are cached on the serializer class
+# itself, under these attributes, and looked up in the class's own
+# ``__dict__`` so a subclass never sees its parent's.  That's a single dict
+# lookup (no weakref, as with a ``WeakKeyDictionary``), and classes built at
+# runtime don't stay alive in a module-level cache.
+#
+_HAL_META_ATTR = '_hal_meta_cache'
+_HAL_LIST_SPEC_ATTR = '_hal_list_spec_cache'
+_FIELDS_ATTR = '_hal_fields_cache'
 
+# A ``Meta._links`` entry (see ``utils.link``), compiled by
+# ``_compile_meta_link``.
+#
+_HALLink = namedtuple('_HALLink',
+                      ['rel', 'href', 'pattern', 'kwargs_spec', 'query_spec',
+                       'extra'])
 
-def _link_to_dict(request, instance, link):
-    assert link['pattern'] or link['href'], "Link must have an href or pattern."
+# Normalized list ``Meta`` options for a child serializer class, cached per
+# class by ``HALListSerializer._hal_list_spec``.
+#
+_HALListSpec = namedtuple('_HALListSpec',
+                          ['list_reverse', 'kwargs_spec', 'envelope'])
 
-    try:
-        if link['pattern']:
-            pattern = link['pattern'].get('pattern')
-            kwargs = link['pattern'].get('kwargs')
-            query = link['pattern'].get('query')
+# Raised by ``HALListSerializer.to_representation`` when ``list_reverse`` has
+# kwargs, but the data isn't a RelatedManager to look them up on.
+#
+# TODO(nick): This exception message is confusing...
+#
+_NOT_RELATED_MANAGER_MSG = (
+    "Keyword arguments can only be used with RelatedManagers.  "
+    "Good: User.email_set  Bad: Emails.objects.filter(user=user)")
+
+
+def _compile_meta_link(link):
+    """Compile a ``Meta._links`` entry into a ``_HALLink``.
+
+    The url pattern's kwargs and query are compiled with ``_compile_kwargs``
+    and ``_compile_query``, so serializing an instance only has to fetch the
+    attribute values.
+
+    Raises
+    ------
+    ValueError
+        if the link has neither an ``href`` nor a ``pattern``.
+
+    """
+    pattern = kwargs_spec = query_spec = None
+    link_pattern = link.get('pattern')
+    if isinstance(link_pattern, _str_types):
+        pattern = link_pattern
+    elif link_pattern:
+        pattern = link_pattern.get('pattern')
+        kwargs_spec = _compile_kwargs(link_pattern.get('kwargs'))
+        query_spec = _compile_query(link_pattern.get('query'))
+    href = link.get('href')
+    if not (pattern or href):
+        raise ValueError("Link must have an href or pattern.")
+
+    # The optional link properties, included only when they're set.
+    extra = tuple((key, link[key]) for key in ('name', 'profile')
+                  if link.get(key))
+    return _HALLink(link['rel'], href, pattern, kwargs_spec, query_spec,
+                    extra)
 
-            if kwargs:
-                kwargs = {k: getattr(instance, v) for k, v in kwargs.items()}
-                url = reverse(pattern, kwargs=kwargs, request=request)
-            else:
-                url = reverse(pattern, request=request)
 
-            if query:
-                query = {k: getattr(instance, v) for k, v in query.items()}
-                url = u'%s?%s' % (url, urlencode(query))
+def _link_to_dict(request, instance, link):
+    url = link.href
+    pattern = link.pattern
+    if pattern:
+        kwargs = None
+        kwargs_spec = link.kwargs_spec
+        if kwargs_spec:
+            keys, getter = kwargs_spec
+            kwargs = tuple(zip(keys, getter(instance)))
+        try:
+            url = _cached_reverse(pattern, kwargs, request)
+        except NoReverseMatch:
+            return None
 
-    except urlresolvers.NoReverseMatch:
-        url = None
-        return None  # ?
+        url = _append_query(url, link.query_spec, instance)
 
     ret = {
         'href': url,
     }
-    if link.get('name'):
-        ret['name'] = link['name']
-    if link.get('profile'):
-        ret['profile'] = link['profile']
-
+    if link.extra:
+        ret.update(link.extra)
     return ret
 
 
 def _process_links(links_dict, request, instance, links):
     ret = links_dict
+    get_current = ret.get
     for link in links:
+        rel = link.rel
         link_dict = _link_to_dict(request, instance, link)
 
         # If there is an existing entry for ``rel``, ``rel`` becomes
@@ -98,16 +138,90 @@ def _process_links(links_dict, request, instance, links):
         #
         # .. seealso:: https://tools.ietf.org/html/draft-kelly-json-hal-08#section-4.1.1
         #
-        current = ret.get(link['rel'])
+        current = get_current(rel)
         if not current:
-            ret[link['rel']] = link_dict
+            ret[rel] = link_dict
+        elif type(current) is list:
+            current.append(link_dict)
         else:
-            if isinstance(current, dict):
-                ret[link['rel']] = [current]
-            ret[link['rel']].append(link_dict)
+            ret[rel] = [current, link_dict]
     return ret
 
 
+class _LazyLinks(Mapping):
+    """A read-only ``_links`` mapping that only reverses urls when read.
+
+    Used in place of the ``_links`` dict when ``Meta.lazy_links`` is set, so
+    embedded representations that never read their ``_links`` skip url
+    resolution entirely.  The keys are known up front from ``Meta._links``;
+    each rel is built (and memoized) the first time it is accessed.
+
+    """
+    def __init__(self, serializer, instance, hal_meta):
+        self._serializer = serializer
+        self._instance = instance
+        self._hal_meta = hal_meta
+        self._cache = {}
+
+    def __getitem__(self, rel):
+        try:
+            return self._cache[rel]
+        except KeyError:
+            pass
+
+        links = self._hal_meta.links_by_rel[rel]
+        serializer, instance = self._serializer, self._instance
+        request = serializer._get_request()
+        links_dict = {}
+        if rel == 'self':
+            links_dict['self'] = serializer._get_self_link(instance)
+        _process_links(links_dict, request, instance, links)
+        value = self._cache[rel] = links_dict[rel]
+        return value
+
+    def __iter__(self):
+        return iter(self._hal_meta.rels)
+
+    def __len__(self):
+        return len(self._hal_meta.rels)
+
+    def __repr__(self):
+        return repr(self.materialize())
+
+    def __reduce__(self):
+        # Pickle (e.g., for the cache framework) as a plain dict, rather than
+        # dragging the serializer along.
+        return (_Dict, (list(self.materialize().items()),))
+
+    def materialize(self):
+        """Return the links as a plain (ordered) dict."""
+        return _Dict((rel, self[rel]) for rel in self)
+
+
+def _compile_envelope(profile):
+    """Return a function that builds the HAL envelope for a list.
+
+    The envelope, ``{'_links': {'self': ...}, '_embedded': {...}}``, only
+    varies by the list's url and results, so the rest of it (the ``profile``
+    and the ``_embedded`` key) is bound once per child serializer class.
+
+    """
+    embedded_key = profile or 'item'
+
+    if profile:
+        def envelope(href, results):
+            ret = _Dict()
+            ret['_links'] = {'self': {'href': href, 'profile': profile}}
+            ret['_embedded'] = {embedded_key: results}
+            return ret
+    else:
+        def envelope(href, results):
+            ret = _Dict()
+            ret['_links'] = {'self': {'href': href}}
+            ret['_embedded'] = {embedded_key: results}
+            return ret
+    return envelope
+
 
 class BaseSerializerDataMixin(object):
     """Mixin to include ``rest_framework.serializers.BaseSerializer.data``.
@@ -133,7 +247,12 @@ class BaseSerializerDataMixin(object):
 
     """
     def base_serializer_data(self):
-        if hasattr(self, 'initial_data') and not hasattr(self, '_validated_data'):
+        # These are all instance attributes (set by DRF, or below), so check
+        # the instance dict, rather than ``hasattr`` raising and catching an
+        # ``AttributeError`` for the ones that are missing.
+        #
+        attrs = self.__dict__
+        if 'initial_data' in attrs and '_validated_data' not in attrs:
             msg = (
                 'When a serializer is passed a `data` keyword argument you '
                 'must call `.is_valid()` before attempting to access the '
@@ -143,10 +262,10 @@ class BaseSerializerDataMixin(object):
             )
             raise AssertionError(msg)
 
-        if not hasattr(self, '_data'):
-            if self.instance is not None and not getattr(self, '_errors', None):  # noqa
+        if '_data' not in attrs:
+            if self.instance is not None and not attrs.get('_errors'):
                 self._data = self.to_representation(self.instance)
-            elif hasattr(self, '_validated_data') and not getattr(self, '_errors', None):  # noqa
+            elif '_validated_data' in attrs and not attrs.get('_errors'):
                 self._data = self.to_representation(self.validated_data)
             else:
                 self._data = self.get_initial()
@@ -161,160 +280,300 @@ class HALListSerializer(BaseSerializerDataMixin, serializers.ListSerializer):
             return None
         return getattr(meta, key, default)
 
-    def to_representation(self, data):
-        results = super(HALListSerializer, self).to_representation(data)
+    def _hal_list_spec(self):
+        """Return the normalized list ``Meta`` options for the child class.
+
+        ``list_reverse`` and ``profile`` are static per child serializer class,
+        so they are only parsed the first time a list of that class is
+        rendered.
+
+        """
+        child_class = type(self.child)
+        spec = child_class.__dict__.get(_HAL_LIST_SPEC_ATTR)
+        if spec is not None:
+            return spec
 
         list_reverse = self._get_meta('list_reverse')
         assert list_reverse, "HALSerializer Meta class must define list_reverse."  # noqa
 
-        # Handle reverse-relationships where the API route/url is defined by an
-        # attribute on the parent.  Example, `/api/users/32/emails/`, the
-        # list-view url is defined by the `pk` on the `User` model, so we need
-        # to access `data.instance.pk` to reverse the url, essentially
-        # preforming something like: `reverse('api:user-email-list',
-        # pk=data.instance.pk)`.
-        #
-        kwargs = {}
+        kwargs = None
         if isinstance(list_reverse, tuple):
             list_reverse, kwargs = list_reverse
 
-            if not isinstance(kwargs, dict):
+            if isinstance(kwargs, _str_types):
                 # kwargs is a string where the key == the instance attribute
                 # name.
                 #
                 kwargs = {kwargs: kwargs}
 
+        # resource_name = self._get_meta('resource_name', 'items') # DEPRECATED
+        # rel = self._get_meta('rel', 'item')  # DEPRECATED
+        profile = self._get_meta('profile')
+
+        spec = _HALListSpec(list_reverse, _compile_kwargs(kwargs),
+                            _compile_envelope(profile))
+        setattr(child_class, _HAL_LIST_SPEC_ATTR, spec)
+        return spec
+
+    def to_representation(self, data):
+        # Equivalent to ``ListSerializer.to_representation``, with the child's
+        # bound method looked up once rather than for every item.
+        #
+        child_to_representation = self.child.to_representation
+        iterable = (data.all() if isinstance(data, models.manager.BaseManager)
+                    else data)
+        results = [child_to_representation(item) for item in iterable]
+
+        list_reverse, kwargs_spec, envelope = self._hal_list_spec()
+
+        # Handle reverse-relationships where the API route/url is defined by an
+        # attribute on the parent.  Example, `/api/users/32/emails/`, the
+        # list-view url is defined by the `pk` on the `User` model, so we need
+        # to access `data.instance.pk` to reverse the url, essentially
+        # preforming something like: `reverse('api:user-email-list',
+        # pk=data.instance.pk)`.
+        #
+        kwargs = {}
+        if kwargs_spec is not None:
             # DEBUG: Verify that we have been passed a RelatedManager.
             #
             if hasattr(data, 'instance'):
-                kwargs = {k: getattr(data.instance, v)
-                          for k, v in kwargs.items()}
+                keys, getter = kwargs_spec
+                kwargs = dict(zip(keys, getter(data.instance)))
             else:
                 # If the QuerySet is not a RelatedManager, there is no
                 # `instance` to get attributes from.
                 #
-                raise Exception((
-                    "Keyword arguments can only be used with "
-                    "RelatedManagers.  Good: User.email_set "
-                    "Bad: Emails.objects.filter(user=user)  "
-                    "[[TODO(nick): This exception message is confusing...]]"))
-
-        # resource_name = self._get_meta('resource_name', 'items') # DEPRECATED
-        # rel = self._get_meta('rel', 'item')  # DEPRECATED
-        profile = self._get_meta('profile', 'item')
+                raise TypeError(_NOT_RELATED_MANAGER_MSG)
 
         request = self.context.get('request')
-        self_url = reverse(list_reverse, request=self.context.get('request'),
-                           kwargs=kwargs)
-        if request.GET:
-            query_args = {k: v for k, v in request.GET.items()}
-            self_url = u'%s?%s' % (self_url, urlencode(query_args))
-
-        self_link = {
-            'href': self_url,
-        }
-        profile = self._get_meta('profile')
-        if profile:
-            self_link['profile'] = profile
-
-        ret = OrderedDict(
-            _links={
-                'self': self_link,
-            },
-            _embedded={
-                profile: results,
-            },
-        )
-        return ret
+        self_url = reverse(list_reverse, request=request, kwargs=kwargs)
+        if request is not None and request.GET:
+            self_url = '?'.join((self_url, request.GET.urlencode()))
+
+        return envelope(self_url, results)
 
     @property
     def data(self):
         data = self.base_serializer_data()
-        return ReturnDict(data, serializer=self)
 
+        # Only the HTML renderers use ``data.serializer`` (to build forms).
+        # Everywhere else, return a plain (shallow) copy, without the
+        # ``ReturnDict``'s reference back to the serializer that keeps it
+        # alive along with the data.  Like ``ReturnDict``, the copy keeps
+        # callers from mutating the cached ``_data``.
+        #
+        request = self.context.get('request')
+        renderer = getattr(request, 'accepted_renderer', None)
+        if isinstance(renderer, (BrowsableAPIRenderer, HTMLFormRenderer)):
+            return ReturnDict(data, serializer=self)
+        return _Dict(data)
 
-class HALSerializer(BaseSerializerDataMixin, serializers.Serializer):
-    """Serializer that returns data in HAL-format.
 
-    For the ListSerializer to work correctly, you must define ``rel``
-    and ``list_reverse`` on your subclass's ``Meta`` class.
+class _HALSerializerMixin(BaseSerializerDataMixin):
+    """Request handling and list construction shared by the HAL serializers.
+
+    Accepts a ``request`` keyword argument (moved into the context), and
+    wraps ``many=True`` instances in a ``HALListSerializer``.
 
     """
     def __init__(self, *args, **kwargs):
-        move_request_from_kwargs_to_context(kwargs)
-        super(HALSerializer, self).__init__(*args, **kwargs)
+        if 'request' in kwargs:
+            move_request_from_kwargs_to_context(kwargs)
+        super(_HALSerializerMixin, self).__init__(*args, **kwargs)
 
     @classmethod
     def many_init(cls, *args, **kwargs):
-        kwargs['child'] = cls()
+        # The child can't be a shared, per-class prototype: the list binds it
+        # (setting its parent, and so its context and request), and it caches
+        # the request itself, so it must belong to this list alone.
+        if 'child' not in kwargs:
+            kwargs['child'] = cls()
         move_request_from_kwargs_to_context(kwargs)
         return HALListSerializer(*args, **kwargs)
 
 
-class HALModelSerializer(BaseSerializerDataMixin, serializers.ModelSerializer):
+class HALSerializer(_HALSerializerMixin, serializers.Serializer):
+    """Serializer that returns data in HAL-format.
+
+    For the ListSerializer to work correctly, you must define ``rel``
+    and ``list_reverse`` on your subclass's ``Meta`` class.
+
+    """
+
+
+class HALModelSerializer(_HALSerializerMixin, serializers.ModelSerializer):
     """ModelSerializer that returns data in HAL-format.
 
     For the ListSerializer to work correctly, you must define ``resource_name``
     and ``list_reverse`` on your subclass's ``Meta`` class.
 
+    Setting ``lazy_links = True`` on ``Meta`` makes ``_links`` a read-only
+    mapping that only reverses urls when it is read.  This saves the url
+    resolution for nested representations whose ``_links`` are never used,
+    but the result is not a ``dict``, so it can only be rendered by encoders
+    that accept any mapping (like DRF's ``JSONRenderer``).
+
+    Setting ``cache_fields = True`` on ``Meta`` builds the fields from the
+    model once per class, and gives each instance a copy.  Only use it when
+    ``get_field_names``, ``get_extra_kwargs`` and ``build_field`` don't depend
+    on ``self.instance`` or ``self.context`` (e.g., making a field read-only
+    on update), since every instance reuses what the first one built.
+
     """
     def __init__(self, *args, **kwargs):
-        move_request_from_kwargs_to_context(kwargs)
         super(HALModelSerializer, self).__init__(*args, **kwargs)
+        self._request = None
+
+    def bind(self, field_name, parent):
+        super(HALModelSerializer, self).bind(field_name, parent)
+        self._request = None
+
+    def _get_request(self):
+        """Return the request from the context, looked up on first use.
+
+        When this is the child of a list, ``self.context`` walks up to the root
+        serializer for every row, so the request is cached on the instance.
+
+        """
+        request = self._request
+        if request is None:
+            request = self._request = self.context.get('request')
+        return request
+
+    def get_fields(self):
+        """Return the serializer's fields, cached per class if opted in.
+
+        With ``Meta.cache_fields``, ``ModelSerializer.get_fields`` only
+        introspects the model the first time, rather than on every
+        instantiation (e.g., for every nested serializer in a list).  Fields
+        are bound to the serializer instance, so each instance gets a deep
+        copy, the same way DRF copies declared fields.
+
+        """
+        cls = type(self)
+        if not getattr(getattr(cls, 'Meta', None), 'cache_fields', False):
+            return super(HALModelSerializer, self).get_fields()
+
+        fields = cls.__dict__.get(_FIELDS_ATTR)
+        if fields is None:
+            fields = super(HALModelSerializer, self).get_fields()
+            setattr(cls, _FIELDS_ATTR, fields)
+        return copy.deepcopy(fields)
 
     @classmethod
-    def many_init(cls, *args, **kwargs):
-        kwargs['child'] = cls()
-        move_request_from_kwargs_to_context(kwargs)
-        return HALListSerializer(*args, **kwargs)
+    def _hal_meta(cls):
+        """Return the normalized HAL ``Meta`` options for this class.
 
-    def _get_self_link(self, instance):
-        request = self.context.get('request')
-        pattern = getattr(self.Meta, 'detail_reverse')
+        ``Meta`` is static per serializer class, so ``_links`` and
+        ``detail_reverse`` are only parsed the first time they are needed.
 
-        if isinstance(pattern, basestring):
-            pattern = (pattern, {'pk': 'pk'})
-        elif isinstance(pattern[1], basestring):
-            pattern = (pattern[0], {pattern[1]: pattern[1]})
-        return {'href': reverse(pattern[0],
-                                kwargs={k:getattr(instance, v)
-                                        for k, v in pattern[1].items()},
-                                request=request)}
+        """
+        hal_meta = cls.__dict__.get(_HAL_META_ATTR)
+        if hal_meta is not None:
+            return hal_meta
+
+        meta = getattr(cls, 'Meta', None)
+        links = getattr(meta, '_links', None)
+        if links:
+            links = tuple(_compile_meta_link(link) for link in links)
+        pattern = getattr(meta, 'detail_reverse', None)
+
+        detail_pattern = detail_kwargs_spec = None
+        if pattern is not None:
+            if isinstance(pattern, _str_types):
+                pattern = (pattern, {'pk': 'pk'})
+            elif isinstance(pattern[1], _str_types):
+                pattern = (pattern[0], {pattern[1]: pattern[1]})
+            detail_pattern = pattern[0]
+            detail_kwargs_spec = _compile_kwargs(pattern[1])
+
+        lazy_links = getattr(meta, 'lazy_links', False)
+        rels = ['self']
+        links_by_rel = {'self': []}
+        for link in links or ():
+            rel = link.rel
+            if rel not in links_by_rel:
+                rels.append(rel)
+                links_by_rel[rel] = []
+            links_by_rel[rel].append(link)
+
+        hal_meta = _HALMeta(links, detail_pattern, detail_kwargs_spec,
+                            lazy_links, tuple(rels), links_by_rel)
+        setattr(cls, _HAL_META_ATTR, hal_meta)
+        return hal_meta
+
+    def _get_self_link(self, instance):
+        hal_meta = self._hal_meta()
+        kwargs = None
+        if hal_meta.detail_kwargs_spec:
+            keys, getter = hal_meta.detail_kwargs_spec
+            kwargs = tuple(zip(keys, getter(instance)))
+        return {'href': _cached_reverse(hal_meta.detail_pattern, kwargs,
+                                        self._get_request())}
 
     def to_representation(self, instance):
         """
         Object instance -> Dict of primitive datatypes.
         """
-        ret = OrderedDict()
-        fields = self._readable_fields
-
-        request = self.context.get('request')
+        ret = _Dict()
 
-        meta_links = getattr(self.Meta, '_links', None)
-        if meta_links:
+        # The readable fields are fixed once the serializer is bound, so the
+        # bound methods are only looked up the first time an instance (of a
+        # many=True list, say) is serialized.
+        #
+        field_triples = self.__dict__.get('_field_triples')
+        if field_triples is None:
+            field_triples = self._field_triples = [
+                (field.field_name, field.get_attribute,
+                 field.to_representation)
+                for field in self._readable_fields]
+
+        request = self._get_request()
+
+        hal_meta = self._hal_meta()
+        if hal_meta.links and hal_meta.lazy_links:
+            ret['_links'] = _LazyLinks(self, instance, hal_meta)
+        elif hal_meta.links:
             self_link = self._get_self_link(instance)
-            links_dict = OrderedDict((
+            links_dict = _Dict((
                 ('self', self_link),
             ))
-            _links = _process_links(links_dict, request, instance, meta_links)
+            _links = _process_links(links_dict, request, instance,
+                                    hal_meta.links)
             ret['_links'] = _links
 
-        for field in fields:
+        for field_name, get_attribute, to_representation in field_triples:
             try:
-                attribute = field.get_attribute(instance)
+                attribute = get_attribute(instance)
             except SkipField:
                 continue
 
             if attribute is None:
                 # We skip `to_representation` for `None` values so that
                 # fields do not have to explicitly deal with that case.
-                ret[field.field_name] = None
+                ret[field_name] = None
             else:
-                ret[field.field_name] = field.to_representation(attribute)
+                ret[field_name] = to_representation(attribute)
 
         return ret
 
 
+# Namespaced view names built by ``_namespaced_view_name``, keyed on
+# ``(namespace, view_name)``.
+#
+_VIEW_NAME_CACHE = {}
+
+
+def _namespaced_view_name(namespace, view_name):
+    """Return ``'namespace:view_name'``, built once per pair."""
+    key = (namespace, view_name)
+    namespaced = _VIEW_NAME_CACHE.get(key)
+    if namespaced is None:
+        namespaced = _VIEW_NAME_CACHE[key] = ':'.join(key)
+    return namespaced
+
+
 class HyperlinkedModelSerializer(serializers.HyperlinkedModelSerializer):
     """`HyperlinkedModelSerializer` that supports url namespacing.
 
@@ -341,16 +600,16 @@ class HyperlinkedModelSerializer(serializers.HyperlinkedModelSerializer):
             HyperlinkedModelSerializer, self).build_relational_field(
                 field_name, relation_info)
         namespace = relation_info.related_model._meta.app_label
-        view_name = ':'.join((namespace, kwargs['view_name']))
-        kwargs['view_name'] = view_name
+        kwargs['view_name'] = _namespaced_view_name(namespace,
+                                                    kwargs['view_name'])
         return cls, kwargs
 
     def build_url_field(self, field_name, model_class):
       cls, kwargs = super(HyperlinkedModelSerializer, self).build_url_field(
           field_name, model_class)
       namespace = model_class._meta.app_label
-      view_name = ':'.join((namespace, kwargs['view_name']))
-      kwargs['view_name'] = view_name
+      kwargs['view_name'] = _namespaced_view_name(namespace,
+                                                  kwargs['view_name'])
       return cls, kwargs
 
 
@@ -4,9 +4,44 @@ General utilities for django_hal
 """
 
 
-from django.core.urlresolvers import reverse as dj_reverse, NoReverseMatch
+from collections import OrderedDict
+from operator import attrgetter
+from sys import version_info
+from uuid import UUID
+
+try:
+    from urllib.parse import quote_plus as _quote_plus
+except ImportError:  # Python 2
+    from urllib import quote_plus as _quote_plus
+
+from django.core.signals import setting_changed
+try:
+    from django.urls import (
+        reverse as dj_reverse, NoReverseMatch, get_script_prefix, get_urlconf)
+except ImportError:  # Django < 1.10
+    from django.core.urlresolvers import (
+        reverse as dj_reverse, NoReverseMatch, get_script_prefix, get_urlconf)
+from django.utils.encoding import force_str as _force_str
+from django.utils.http import urlencode as _urlencode
+from django.utils.translation import get_language
 from rest_framework.reverse import reverse as rf_reverse
 
+try:
+    from rest_framework.reverse import preserve_builtin_query_params
+except ImportError:  # djangorestframework < 3.2
+    def preserve_builtin_query_params(url, request=None):
+        return url
+
+
+try:
+    _str_types = basestring
+except NameError:  # Python 3
+    _str_types = str
+
+# Built-in dicts are insertion ordered (and cheaper than ``OrderedDict``) on
+# Python 3.7+.
+_Dict = dict if version_info >= (3, 7) else OrderedDict
+
 
 # TODO(nick): It may be a better idea to use the django sites framework to get
 #     the base url to a resource, rather than the request.  This would decouple
@@ -29,22 +64,230 @@ def reverse(*args, **kwargs):
     This is very useful for situations where you don't have a request to pass,
     for instance, when using the shell or during testing.
 
+    For the common case (a view name, with optional ``kwargs`` and ``format``)
+    the relative path is memoized (see ``_reverse_path``), so only
+    ``request.build_absolute_uri`` runs for each url.  Anything else, including
+    requests with a DRF versioning scheme, goes through DRF's ``reverse``.
+
     """
-    request = kwargs.pop('request')
-    if request:
-        return rf_reverse(*args, request=request, **kwargs)
-    else:
+    request = kwargs.pop('request', None)
+    if (len(args) != 1 or not _FAST_REVERSE_KWARGS.issuperset(kwargs) or
+            getattr(request, 'versioning_scheme', None) is not None):
+        if request:
+            return rf_reverse(*args, request=request, **kwargs)
         return dj_reverse(*args, **kwargs)
 
+    url_kwargs = kwargs.get('kwargs')
+    format = kwargs.get('format')
+    if format is not None:
+        url_kwargs = dict(url_kwargs or {}, format=format)
+
+    path = _reverse_path(args[0], url_kwargs)
+    if not request:
+        return path
+    return preserve_builtin_query_params(request.build_absolute_uri(path),
+                                         request)
+
+
+_FAST_REVERSE_KWARGS = frozenset(('kwargs', 'format'))
+
+# Relative paths memoized by ``_reverse_path``.  Paths without kwargs are
+# bounded by the number of named urlpatterns, so they're kept indefinitely.
+# Paths with kwargs include their values (i.e., primary keys), so they're kept
+# in a separate least-recently-used cache, where a long list of detail urls
+# can't evict the static paths.
+#
+_REVERSE_CACHE = {}
+_REVERSE_KWARGS_CACHE = OrderedDict()
+_REVERSE_CACHE_SIZE = 1024
+
+# See ``_kwargs_key``.  Exact types only: e.g., ``True`` is an ``int``, but
+# reverses to ``'True'``.
+#
+try:
+    _CACHEABLE_KWARG_TYPES = frozenset((int, long, str, unicode, UUID))
+except NameError:  # Python 3
+    _CACHEABLE_KWARG_TYPES = frozenset((int, str, UUID))
+
+
+def _kwargs_key(kwargs_items):
+    """Return a cache key for an iterable of ``(kwarg, value)`` pairs.
+
+    Values that compare equal can reverse to different urls, even within a
+    type (e.g., ``Decimal('1.0')`` and ``Decimal('1.00')``, or ``0.0`` and
+    ``-0.0``), so only values of the types in ``_CACHEABLE_KWARG_TYPES``,
+    where equal values always have the same string form, are cached.  Raises
+    ``TypeError`` (like an unhashable value would) for any other value.
+
+        >>> from decimal import Decimal
+        >>> _kwargs_key([('pk', 1)])
+        (('pk', 1),)
+        >>> _kwargs_key([('val', Decimal('1.0'))])
+        Traceback (most recent call last):
+          ...
+        TypeError: Decimal
+
+    """
+    for _, value in kwargs_items:
+        if type(value) not in _CACHEABLE_KWARG_TYPES:
+            raise TypeError(type(value).__name__)
+    return tuple(sorted(kwargs_items))
+
+
+def _reverse_path(viewname, kwargs):
+    """Return Django's ``reverse(viewname, kwargs=kwargs)``.
+
+    The result is memoized, keyed on everything else ``reverse`` depends on:
+    the active urlconf, script prefix and language.
+
+    """
+    if not kwargs:
+        key = (viewname, get_urlconf(), get_script_prefix(), get_language())
+        try:
+            return _REVERSE_CACHE[key]
+        except KeyError:
+            path = _REVERSE_CACHE[key] = dj_reverse(viewname)
+            return path
+
+    cache = _REVERSE_KWARGS_CACHE
+    try:
+        key = (viewname, _kwargs_key(kwargs.items()), get_urlconf(),
+               get_script_prefix(), get_language())
+        # Re-inserted below, as the most recently used entry.
+        path = cache.pop(key)
+    except KeyError:
+        path = dj_reverse(viewname, kwargs=kwargs)
+        if len(cache) >= _REVERSE_CACHE_SIZE:
+            cache.popitem(last=False)
+    except TypeError:
+        # A kwarg value that can't be cached (see ``_kwargs_key``).
+        return dj_reverse(viewname, kwargs=kwargs)
+    cache[key] = path
+    return path
+
+
+def _clear_reverse_cache(**kwargs):
+    _REVERSE_CACHE.clear()
+    _REVERSE_KWARGS_CACHE.clear()
+
+
+setting_changed.connect(_clear_reverse_cache)
+
+
+def _cached_reverse(urlpattern, kwargs_items, request):
+    """Return ``reverse(urlpattern, kwargs=dict(kwargs_items))``.
+
+    When there is a request, urls are memoized on it, so a link that is
+    repeated across the rows of a response (e.g., every book linking to the
+    same author) only goes through the url resolver once.
+
+    Parameters
+    ----------
+    urlpattern : str
+        A named urlpattern.
+    kwargs_items : Optional[tuple]
+        A tuple of `(kwarg, value)` pairs to reverse the url with.
+    request : Optional[Request]
+        The current request, used to build absolute urls.
+
+    """
+    if request is None:
+        kwargs = dict(kwargs_items) if kwargs_items else None
+        return reverse(urlpattern, kwargs=kwargs, request=request)
+
+    try:
+        cache = request._hal_reverse_cache
+    except AttributeError:
+        cache = request._hal_reverse_cache = {}
+
+    # The kwargs dict is only built on a miss, not for every hit.
+    try:
+        key = (urlpattern,
+               _kwargs_key(kwargs_items) if kwargs_items else None)
+        return cache[key]
+    except KeyError:
+        kwargs = dict(kwargs_items) if kwargs_items else None
+        url = cache[key] = reverse(urlpattern, kwargs=kwargs, request=request)
+        return url
+    except TypeError:
+        # A kwarg value that can't be cached (see ``_kwargs_key``).
+        kwargs = dict(kwargs_items) if kwargs_items else None
+        return reverse(urlpattern, kwargs=kwargs, request=request)
+
+
+def _compile_kwargs(kwargs):
+    """Compile a ``{kwarg: attribute}`` dict into ``(kwargs, getter)``.
+
+    ``kwargs`` is a tuple of the keys, and ``getter(instance)`` returns a tuple
+    of the matching attribute values, fetched with a single ``attrgetter``
+    call.  Returns ``None`` if there are no kwargs.
+
+    """
+    if not kwargs:
+        return None
+    keys = tuple(kwargs)
+    if len(keys) == 1:
+        # ``attrgetter`` only returns a tuple when given multiple attributes.
+        get_value = attrgetter(kwargs[keys[0]])
+        return keys, lambda instance: (get_value(instance),)
+    return keys, attrgetter(*[kwargs[k] for k in keys])
+
+
+def _compile_query(query):
+    """Compile a ``{kwarg: attribute}`` query dict into ``(format, keys,
+    getter)``.
+
+    ``format`` is the query string with the (already quoted) keys filled in
+    and a ``%s`` placeholder for each value, e.g. ``'author=%s&page=%s'``, and
+    ``keys`` and ``getter`` are as returned by ``_compile_kwargs``.  See
+    ``_append_query``.  Returns ``None`` if there is no query.
+
+    """
+    spec = _compile_kwargs(query)
+    if spec is None:
+        return None
+    keys, getter = spec
+    query_format = u'&'.join(
+        u'%s=%%s' % _quote_plus(_force_str(k)).replace('%', '%%')
+        for k in keys)
+    return query_format, keys, getter
+
+
+def _append_query(url, query_spec, instance, _quote_plus=_quote_plus,
+                  _force_str=_force_str):
+    """Return ``url`` with the query compiled by ``_compile_query`` appended.
+
+    The values are quoted the same way ``urlencode`` would, but without
+    building a dict and encoding the keys for every instance.  A ``None``
+    value is left to ``urlencode`` itself, since its handling depends on the
+    Django version (``'None'`` before 2.2, a ``TypeError`` since).
+
+    """
+    if query_spec is None:
+        return url
+    query_format, keys, getter = query_spec
+    values = getter(instance)
+    if any(v is None for v in values):
+        return '?'.join((url, _urlencode(tuple(zip(keys, values)))))
+    values = tuple(_quote_plus(_force_str(v)) for v in values)
+    return '?'.join((url, query_format % values))
+
+
+def _with_query(url, query, _urlencode=_urlencode):
+    """Return ``url`` with ``query`` appended as a query string, if any."""
+    if not query:
+        return url
+    return '?'.join((url, _urlencode(query)))
+
 
 def move_request_from_kwargs_to_context(kwargs):
     """Relocate ``kwargs['request']`` to ``kwargs['context']['request']``."""
     request = kwargs.pop('request', None)
-    if request:
-        if 'context' not in kwargs:
-            kwargs['context'] = {'request': request}
-        elif not kwargs['context'].get('request'):
-            kwargs['context']['request'] = request
+    if request is None:
+        return
+    context = kwargs.setdefault('context', {})
+    if not context.get('request'):
+        context['request'] = request
 
 
 def link(rel=None, name=None, profile=None, pattern=None):
@@ -113,7 +356,7 @@ def pattern(pattern, kwargs=None, query=None):
     # attribute are the same, you may use a string instead of a dict with the
     # same key/value (e.g., 'pk' instead of {'pk': 'pk'}.
     #
-    if isinstance(kwargs, basestring):
+    if isinstance(kwargs, _str_types):
         kwargs = {kwargs: kwargs}
 
     return {